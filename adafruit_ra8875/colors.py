@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2019 Melissa LeBlanc-Williams for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ra8875.colors`
+====================================================
+
+Color conversions for the RA8875 drivers. These are also available from
+:mod:`adafruit_ra8875.ra8875`.
+
+* Author(s): Melissa LeBlanc-Williams
+"""
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+
+# pylint: disable-msg=invalid-name
+def color565(r: int, g: int = 0, b: int = 0) -> int:
+    """Convert red, green and blue values (0-255) into a 16-bit 565 encoding."""
+    if not isinstance(r, int):
+        r, g, b = r  # the first var is a tuple/list
+    return (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
+
+
+def color565_fast(r: int, g: int, b: int) -> int:
+    """
+    Convert red, green and blue values (0-255) into a 16-bit 565 encoding.
+    Unlike color565, the values must be passed separately, which avoids the
+    tuple check and makes it cheaper to call per pixel.
+    """
+    return (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
+
+
+def _rgb565_split(color: int) -> Tuple[int, int, int]:
+    """
+    Split a 565 color into the values of its red, green and blue registers
+
+    :param int color: The 565 color to split
+    :return: The 5-bit red, 6-bit green and 5-bit blue values
+    :rtype: tuple[int, int, int]
+    """
+    return (color >> 11) & 0x1F, (color >> 5) & 0x3F, color & 0x1F
+
+
+def color565_packed(r: int, g: int = 0, b: int = 0) -> bytes:
+    """
+    Convert red, green and blue values (0-255) into the 5-bit red, 6-bit green and
+    5-bit blue values of the color registers. set_color and the shape drawing
+    functions accept this in place of a 565 color, which saves splitting it again
+    every time a color from a fixed palette is used.
+    """
+    return bytes(_rgb565_split(color565(r, g, b)))
+
+
+def _color_regs(color: Union[int, bytes]) -> Tuple[int, int, int]:
+    """
+    Get the red, green and blue register values of a 565 or packed color
+
+    :param color: A 565 color or the bytes returned by color565_packed
+    :type color: int or bytes
+    :return: The 5-bit red, 6-bit green and 5-bit blue values
+    :rtype: tuple[int, int, int]
+    """
+    if isinstance(color, int):
+        return _rgb565_split(color)
+    if (
+        not isinstance(color, (bytes, bytearray))
+        or len(color) != 3
+        or color[0] > 0x1F
+        or color[1] > 0x3F
+        or color[2] > 0x1F
+    ):
+        raise ValueError("Colors must be a 565 value or from color565_packed.")
+    return color[0], color[1], color[2]
+
+
+def color565_buffer(rgb: bytes, buf: Optional[bytearray] = None) -> bytearray:
+    """
+    Convert packed red, green and blue bytes (0-255) into 16-bit 565 pixel data
+    that can be sent with push_pixels.
+
+    :param bytes rgb: The red, green and blue values, 3 bytes per pixel
+    :param bytearray buf: (optional) A buffer of 2 bytes per pixel to fill
+        instead of allocating a new one (default=None)
+    :return: The big-endian 565 pixel data
+    :rtype: bytearray
+    """
+    count = len(rgb) // 3
+    if buf is None:
+        buf = bytearray(count * 2)
+    i = 0
+    offset = 0
+    while count:
+        g = rgb[i + 1]
+        buf[offset] = rgb[i] & 0xF8 | g >> 5
+        buf[offset + 1] = (g << 3) & 0xE0 | rgb[i + 2] >> 3
+        i += 3
+        offset += 2
+        count -= 1
+    return buf
+
+
+# pylint: enable-msg=invalid-name
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2019 Melissa LeBlanc-Williams for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ra8875.commands`
+====================================================
+
+Recording of hardware accelerated drawing calls for the RA8875 driver
+
+* Author(s): Melissa LeBlanc-Williams
+"""
+
+
+class CommandList:
+    """
+    Drawing calls recorded by :meth:`~adafruit_ra8875.ra8875.RA8875.commands`. The
+    shapes are sent under a single SPI transaction when the ``with`` block ends, or
+    earlier if anything else needs to talk to the display first or
+    :meth:`~adafruit_ra8875.ra8875.RA8875.flush` is called. A block nested in
+    another one adds its shapes to the outer recording. If the block raises, the
+    shapes it recorded that have not been sent yet are dropped.
+
+    :param RA8875 display: The display to draw on
+    """
+
+    def __init__(self, display: "RA8875") -> None:
+        self._display = display
+        self._outer = None
+        self._start = None
+        self.shapes = []
+
+    def __enter__(self) -> "CommandList":
+        display = self._display
+        self._outer = display._recording  # pylint: disable=protected-access
+        if self._outer is None:
+            display._recording = self  # pylint: disable=protected-access
+        else:
+            self._start = (self._outer.shapes, len(self._outer.shapes))
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        if self._outer is not None:
+            # The outermost block sends everything in call order
+            if exception_type is not None:
+                shapes, start = self._start
+                if self._outer.shapes is shapes:
+                    del shapes[start:]
+                else:
+                    # Replayed since the block started, so all of these are ours
+                    self._outer.shapes.clear()
+            self._outer = None
+            self._start = None
+            return
+        display = self._display
+        display._recording = None  # pylint: disable=protected-access
+        shapes = self.shapes
+        self.shapes = []
+        if shapes and exception_type is None:
+            display._submit(shapes)  # pylint: disable=protected-access
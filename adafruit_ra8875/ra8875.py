@@ -26,6 +26,9 @@ Implementation Notes
   https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
 
+# The three driver classes share their private state, so they stay together
+# pylint: disable=too-many-lines
+
 # imports
 import struct
 import time
@@ -33,9 +36,19 @@ import time
 from digitalio import Direction
 from adafruit_bus_device import spi_device
 import adafruit_ra8875.registers as reg
+from adafruit_ra8875.commands import CommandList
+
+# The conversions are kept importable from here for existing code
+from adafruit_ra8875.colors import (  # pylint: disable=unused-import
+    _color_regs,
+    color565,
+    color565_buffer,
+    color565_fast,
+    color565_packed,
+)
 
 try:
-    from typing import Optional, Tuple, Union
+    from typing import List, Optional, Tuple, Union
     from digitalio import DigitalInOut  # pylint: disable=ungrouped-imports
     from busio import SPI
 except ImportError:
@@ -45,20 +58,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RA8875.git"
 
 
-# pylint: disable-msg=invalid-name
-def color565(r: int, g: int = 0, b: int = 0) -> int:
-    """Convert red, green and blue values (0-255) into a 16-bit 565 encoding."""
-    try:
-        r, g, b = r  # see if the first var is a tuple/list
-    except TypeError:
-        pass
-    return (r & 0xF8) << 8 | (g & 0xFC) << 3 | b >> 3
-
-
-# pylint: enable-msg=invalid-name
-
-
-class RA8875_Device:
+class RA8875_Device:  # pylint: disable=too-many-instance-attributes
     """
     Base Class for the Display. Contains all the low level stuff. As well
     as the touch functions. Valid display sizes are currently 800x480 and 480x272.
@@ -68,9 +68,13 @@ class RA8875_Device:
     :param DigitalInOut rst: (optional) The reset pin if it exists (default=None)
     :param int width: (optional) The width of the display in pixels (default=800)
     :param int height: (optional) The height of the display in pixels (default=480)
-    :param int baudrate: (optional) The spi speed (default=6000000)
+    :param int baudrate: (optional) The spi speed (default=6000000). Write-heavy code
+        such as bitmap drawing benefits the most from raising it.
     :param int polarity: (optional) The spi polarity (default=0)
     :param int phase: (optional) The spi phase (default=0)
+    :param int read_baudrate: (optional) A slower spi speed for transfers that read
+        from the display, as the RA8875 reads less reliably at high speeds
+        (default=None, which uses baudrate)
     """
 
     # pylint: disable-msg=invalid-name,too-many-arguments
@@ -84,17 +88,40 @@ class RA8875_Device:
         baudrate: int = 6000000,
         polarity: int = 0,
         phase: int = 0,
+        read_baudrate: Optional[int] = None,
     ) -> None:
         self.spi_device = spi_device.SPIDevice(
             spi, cs, baudrate=baudrate, polarity=polarity, phase=phase
         )
+        if read_baudrate is None or read_baudrate == baudrate:
+            self._read_device = self.spi_device
+        else:
+            self._read_device = spi_device.SPIDevice(
+                spi, cs, baudrate=read_baudrate, polarity=polarity, phase=phase
+            )
         # Display advertised as 480x80 is actually 480x82
         if width == 480 and height == 80:
             height = 82
         self.width = width
         self.height = height
         self._mode = None
+        self._last_color = None
+        self._last_bgcolor = None
+        self._pending_poll = None
+        # Copies of the registers only this driver changes, filled on first read
+        self._shadow = {}
         self._tpin = None
+        self._cs = cs
+        # Preassembled command and data cycles for single register writes
+        self._reg_buf = bytearray((reg.CMDWR[0], 0, reg.DATWR[0], 0))
+        # Single byte scratch for command, data and status transfers
+        self._b1 = bytearray(1)
+        # Data read cycle, shifted out while the reply is clocked in
+        self._rd_out = bytearray((reg.DATRD[0], 0))
+        self._rd_in = bytearray(2)
+        self._st_out = bytearray((reg.CMDRD[0], 0))
+        # Scratch space for batched register writes, grown as needed
+        self._regs_buf = bytearray(64)
         self.rst = rst
         self.vert_offset = 0
         if self.rst:
@@ -137,33 +164,42 @@ class RA8875_Device:
 
         self.pllinit()
 
-        self._write_reg(reg.SYSR, reg.SYSR_16BPP | reg.SYSR_MCU8)
-        self._write_reg(reg.PCSR, pixclk)
+        self._write_regs(
+            ((reg.SYSR, reg.SYSR_16BPP | reg.SYSR_MCU8), (reg.PCSR, pixclk))
+        )
         time.sleep(0.001)
 
-        # Horizontal settings registers
-        self._write_reg(reg.HDWR, self.width // 8 - 1)
-        self._write_reg(reg.HNDFTR, reg.HNDFTR_DE_HIGH)
-        self._write_reg(reg.HNDR, (hsync_nondisp - 2) // 8)
-        self._write_reg(reg.HSTR, hsync_start // 8 - 1)
-        self._write_reg(reg.HPWR, reg.HPWR_LOW + hsync_pw // 8 - 1)
-
-        # Vertical settings registers
-        self._write_reg16(reg.VDHR0, self.height - 1 + self.vert_offset)
-        self._write_reg16(reg.VNDR0, vsync_nondisp - 1)
-        self._write_reg16(reg.VSTR0, vsync_start - 1)
-        self._write_reg(reg.VPWR, reg.VPWR_LOW + vsync_pw - 1)
-
-        # Set active window X
-        self._write_reg16(reg.HSAW0, 0)
-        self._write_reg16(reg.HEAW0, self.width - 1)
-
-        # Set active window Y
-        self._write_reg16(reg.VSAW0, self.vert_offset)
-        self._write_reg16(reg.VEAW0, self.height - 1 + self.vert_offset)
-
-        # Clear the entire window
-        self._write_reg(reg.MCLR, reg.MCLR_START | reg.MCLR_FULL)
+        vdh = self.height - 1 + self.vert_offset
+        self._write_regs(
+            (
+                # Horizontal settings registers
+                (reg.HDWR, (self.width >> 3) - 1),
+                (reg.HNDFTR, reg.HNDFTR_DE_HIGH),
+                (reg.HNDR, (hsync_nondisp - 2) >> 3),
+                (reg.HSTR, (hsync_start >> 3) - 1),
+                (reg.HPWR, reg.HPWR_LOW + (hsync_pw >> 3) - 1),
+                # Vertical settings registers
+                (reg.VDHR0, vdh),
+                (reg.VDHR0 + 1, vdh >> 8),
+                (reg.VNDR0, vsync_nondisp - 1),
+                (reg.VNDR0 + 1, (vsync_nondisp - 1) >> 8),
+                (reg.VSTR0, vsync_start - 1),
+                (reg.VSTR0 + 1, (vsync_start - 1) >> 8),
+                (reg.VPWR, reg.VPWR_LOW + vsync_pw - 1),
+                # Set active window X
+                (reg.HSAW0, 0),
+                (reg.HSAW0 + 1, 0),
+                (reg.HEAW0, self.width - 1),
+                (reg.HEAW0 + 1, (self.width - 1) >> 8),
+                # Set active window Y
+                (reg.VSAW0, self.vert_offset),
+                (reg.VSAW0 + 1, self.vert_offset >> 8),
+                (reg.VEAW0, vdh),
+                (reg.VEAW0 + 1, vdh >> 8),
+                # Clear the entire window
+                (reg.MCLR, reg.MCLR_START | reg.MCLR_FULL),
+            )
+        )
         time.sleep(0.500)
 
         # Turn the display on, enable GPIO, and setup the backlight
@@ -188,21 +224,79 @@ class RA8875_Device:
         :type data: byte or bytearray
         :param bool raw: (optional) Is the data a raw bytearray (default=False)
         """
-        self._write_cmd(cmd)
-        self._write_data(data, raw)
+        if raw:
+            if isinstance(data, str):
+                data = bytes(data, "utf8")
+            with self._acquire() as spi:
+                self._b1[0] = cmd & 0xFF
+                spi.write(reg.CMDWR)  # pylint: disable=no-member
+                spi.write(self._b1)  # pylint: disable=no-member
+                self._cs.value = True
+                self._cs.value = False
+                spi.write(reg.DATWR)  # pylint: disable=no-member
+                spi.write(data)  # pylint: disable=no-member
+            return
+        with self._acquire() as spi:
+            buf = self._reg_buf
+            buf[1] = cmd & 0xFF
+            buf[3] = data & 0xFF
+            self._send_frames(spi, buf, 1)
 
-    def _write_reg16(self, cmd: int, data: Union[int, bytearray]) -> None:
+    def _write_regs(self, regs: Tuple[Tuple[int, int], ...]) -> None:
         """
-        Select a Register and write 2 bytes or push raw data out
+        Write a sequence of registers in a single SPI burst
 
-        :param byte cmd: The register to select
-        :param data: The byte to write to the register
-        :type data: byte or bytearray
+        :param regs: The register and byte pairs to write in order
+        :type regs: tuple[tuple[byte, byte], ...]
+        """
+        with self._acquire() as spi:
+            self._send_frames(spi, self._pack_regs(regs), len(regs))
+
+    def _pack_regs(self, regs: Tuple[Tuple[int, int], ...]) -> bytearray:
+        """
+        Assemble register writes into the shared frame buffer
+
+        :param regs: The register and byte pairs to write in order
+        :type regs: tuple[tuple[byte, byte], ...]
+        :return: The buffer holding the command and data cycles
+        :rtype: bytearray
+        """
+        count = len(regs)
+        buf = self._regs_buf
+        if len(buf) < count * 4:
+            buf = self._regs_buf = bytearray(count * 4)
+        offset = 0
+        for cmd, data in regs:
+            struct.pack_into(
+                "BBBB", buf, offset, reg.CMDWR[0], cmd & 0xFF, reg.DATWR[0], data & 0xFF
+            )
+            offset += 4
+        return buf
+
+    def _write_frames(self, buf: bytearray, count: int) -> None:
+        """
+        Push preassembled register writes while holding the SPI bus
+
+        :param bytearray buf: Command and data cycles, 4 bytes per register
+        :param int count: The number of registers to write from the buffer
+        """
+        with self._acquire() as spi:
+            self._send_frames(spi, buf, count)
+
+    def _send_frames(self, spi: SPI, buf: bytearray, count: int) -> None:
         """
-        self._write_cmd(cmd)
-        self._write_data(data)
-        self._write_cmd(cmd + 1)
-        self._write_data(data >> 8)
+        Push preassembled register writes on a bus the caller already holds
+
+        :param SPI spi: The bus returned by entering the SPI device
+        :param bytearray buf: Command and data cycles, 4 bytes per register
+        :param int count: The number of registers to write from the buffer
+        """
+        chip_select = self._cs
+        for offset in range(0, count * 4, 2):
+            # Each cycle must start with its own chip select edge
+            chip_select.value = True
+            chip_select.value = False
+            spi.write(buf, start=offset, end=offset + 2)
 
     def _write_cmd(self, cmd: int) -> None:
         """
@@ -210,9 +304,10 @@ class RA8875_Device:
 
         :param byte cmd: The register to select
         """
-        with self.spi_device as spi:
+        with self._acquire() as spi:
+            self._b1[0] = cmd & 0xFF
             spi.write(reg.CMDWR)  # pylint: disable=no-member
-            spi.write(bytearray([cmd & 0xFF]))  # pylint: disable=no-member
+            spi.write(self._b1)  # pylint: disable=no-member
 
     def _write_data(self, data: int, raw: bool = False) -> None:
         """
@@ -222,13 +317,14 @@ class RA8875_Device:
         :type data: byte or bytearray
         :param bool raw: (optional) Is the data a raw bytearray (default=False)
         """
-        with self.spi_device as spi:
+        if raw and isinstance(data, str):
+            data = bytes(data, "utf8")
+        with self._acquire() as spi:
+            if not raw:
+                self._b1[0] = data & 0xFF
+                data = self._b1
             spi.write(reg.DATWR)  # pylint: disable=no-member
-            if raw and isinstance(data, str):
-                data = bytes(data, "utf8")
-            spi.write(
-                data if raw else bytearray([data & 0xFF])
-            )  # pylint: disable=no-member
+            spi.write(data)  # pylint: disable=no-member
 
     def _read_reg(self, cmd: int) -> int:
         """
@@ -238,8 +334,55 @@ class RA8875_Device:
         :return: The results of the register
         :rtype: byte
         """
-        self._write_cmd(cmd)
-        return self._read_data()
+        with self._acquire(True) as spi:
+            return self._send_read(spi, cmd)
+
+    def _send_read(self, spi: SPI, cmd: int) -> int:
+        """
+        Select a Register and read a byte on a bus the caller already holds
+
+        :param SPI spi: The bus returned by entering the SPI device
+        :param byte cmd: The register to select
+        :return: The results of the register
+        :rtype: byte
+        """
+        chip_select = self._cs
+        data = self._b1
+        data[0] = cmd & 0xFF
+        chip_select.value = True
+        chip_select.value = False
+        spi.write(reg.CMDWR)  # pylint: disable=no-member
+        spi.write(data)  # pylint: disable=no-member
+        chip_select.value = True
+        chip_select.value = False
+        spi.write_readinto(self._rd_out, self._rd_in)  # pylint: disable=no-member
+        return self._rd_in[1]
+
+    def _read_shadow(self, cmd: int) -> int:
+        """
+        Read a register from its cached copy, only going to the bus the first time
+
+        :param byte cmd: The register to read
+        :return: The last value written to the register
+        :rtype: byte
+        """
+        data = self._shadow.get(cmd)
+        if data is None:
+            data = self._shadow[cmd] = self._read_reg(cmd)
+        return data
+
+    def _write_shadow(self, cmd: int, data: int) -> None:
+        """
+        Write a register and keep a copy for later reads
+
+        :param byte cmd: The register to select
+        :param byte data: The byte to write to the register
+        """
+        data &= 0xFF
+        if self._shadow.get(cmd) == data:
+            return
+        self._write_reg(cmd, data)
+        self._shadow[cmd] = data
 
     def _read_data(self) -> int:
         """
@@ -248,11 +391,29 @@ class RA8875_Device:
         :return: The data of the register
         :rtype: byte
         """
-        data = bytearray(1)
-        with self.spi_device as spi:
-            spi.write(reg.DATRD)  # pylint: disable=no-member
-            spi.readinto(data)  # pylint: disable=no-member
-            return struct.unpack(">B", data)[0]
+        with self._acquire(True) as spi:
+            spi.write_readinto(self._rd_out, self._rd_in)  # pylint: disable=no-member
+        return self._rd_in[1]
+
+    def _acquire(self, read: bool = False) -> spi_device.SPIDevice:
+        """
+        Get the SPI device for a new transaction, once any drawing still in
+        progress has finished
+
+        :param bool read: (optional) Will the transaction read from the display (default=False)
+        :return: The SPI device to enter
+        :rtype: SPIDevice
+        """
+        if self._pending_poll is not None:
+            self.flush()
+        return self._read_device if read else self.spi_device
+
+    def flush(self) -> None:
+        """Wait for the last hardware accelerated drawing operation to finish"""
+        pending = self._pending_poll
+        if pending is not None:
+            self._pending_poll = None
+            self._wait_poll(*pending)
 
     def _wait_poll(self, register: int, mask: int) -> bool:
         """
@@ -264,14 +425,68 @@ class RA8875_Device:
         :return: If the operation completed without a timeout
         :rtype: bool
         """
-        start = int(round(time.time() * 1000))
+        with self._read_device as spi:
+            return self._send_wait_poll(spi, register, mask)
+
+    def _send_wait_poll(self, spi: SPI, register: int, mask: int) -> bool:
+        """
+        Keep checking a status bit on a bus the caller already holds.
+        After 20ms, a timeout will occur and the function will stop waiting.
+
+        :param SPI spi: The bus returned by entering the SPI device
+        :param byte register: The status register to read
+        :param byte mask: The masked bit to check
+        :return: If the operation completed without a timeout
+        :rtype: bool
+        """
+        deadline = time.monotonic_ns() + 20_000_000
+        data = self._b1
+        data[0] = register & 0xFF
+        chip_select = self._cs
+        rd_out = self._rd_out
+        rd_in = self._rd_in
+        delay = 0
+        chip_select.value = True
+        chip_select.value = False
+        spi.write(reg.CMDWR)  # pylint: disable=no-member
+        spi.write(data)  # pylint: disable=no-member
+        # The register stays selected, so only the data read is repeated
+        while True:
+            chip_select.value = True
+            chip_select.value = False
+            spi.write_readinto(rd_out, rd_in)  # pylint: disable=no-member
+            if rd_in[1] & mask == 0:
+                return True
+            if time.monotonic_ns() >= deadline:
+                return False
+            # Back off so large shapes are not polled needlessly often
+            if delay:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.000200)
+            else:
+                delay = 0.000005
+
+    def _send_wait_status(self, spi: SPI, mask: int) -> bool:
+        """
+        Keep checking the status register on a bus the caller already holds.
+        After 20ms, a timeout will occur and the function will stop waiting.
+
+        :param SPI spi: The bus returned by entering the SPI device
+        :param byte mask: The masked bit to check
+        :return: If the operation completed without a timeout
+        :rtype: bool
+        """
+        deadline = time.monotonic_ns() + 20_000_000
+        chip_select = self._cs
+        st_out = self._st_out
+        rd_in = self._rd_in
         while True:
-            time.sleep(0.001)
-            regval = self._read_reg(register)
-            if regval & mask == 0:
+            chip_select.value = True
+            chip_select.value = False
+            spi.write_readinto(st_out, rd_in)  # pylint: disable=no-member
+            if rd_in[1] & mask == 0:
                 return True
-            millis = int(round(time.time() * 1000))
-            if millis - start >= 20:
+            if time.monotonic_ns() >= deadline:
                 return False
 
     def turn_on(self, display_on: bool) -> None:
@@ -291,12 +506,21 @@ class RA8875_Device:
         time.sleep(0.100)
         self.rst.value = 1
         time.sleep(0.100)
+        self._last_color = None
+        self._last_bgcolor = None
+        self._mode = None
+        self._shadow = {}
+        self._pending_poll = None
 
     def soft_reset(self) -> None:
         """Perform a soft reset"""
         self._write_reg(reg.PWRR, reg.PWRR_SOFTRESET)
         self._write_data(reg.PWRR_NORMAL)
         time.sleep(0.001)
+        self._last_color = None
+        self._last_bgcolor = None
+        self._mode = None
+        self._shadow = {}
 
     def sleep(self, sleep: bool) -> None:
         """
@@ -361,9 +585,9 @@ class RA8875_Device:
                 | self._adc_clk,
             )
             self._write_reg(reg.TPCR1, reg.TPCR1_AUTO | reg.TPCR1_DEBOUNCE)
-            self._write_data(self._read_reg(reg.INTC1) | reg.INTC1_TP)
+            self._write_shadow(reg.INTC1, self._read_shadow(reg.INTC1) | reg.INTC1_TP)
         else:
-            self._write_data(self._read_reg(reg.INTC1) & ~reg.INTC1_TP)
+            self._write_shadow(reg.INTC1, self._read_shadow(reg.INTC1) & ~reg.INTC1_TP)
             self._write_reg(reg.TPCR0, reg.TPCR0_DISABLE)
 
     def touched(self) -> bool:
@@ -388,29 +612,36 @@ class RA8875_Device:
         :return: The coordinate of the detected touch
         :rtype: tuple[int, int]
         """
-        touch_x = self._read_reg(reg.TPXH)
-        touch_y = self._read_reg(reg.TPYH)
-        temp = self._read_reg(reg.TPXYL)
+        with self._acquire(True) as spi:
+            buf = self._reg_buf
+            buf[1] = reg.INTC2
+            buf[3] = reg.INTC2_TP
+            touch_x = self._send_read(spi, reg.TPXH)
+            touch_y = self._send_read(spi, reg.TPYH)
+            temp = self._send_read(spi, reg.TPXYL)
+            # Clear the touch interrupt while the bus is still held
+            self._send_frames(spi, buf, 1)
         touch_x = touch_x << 2
         touch_y = touch_y << 2
         touch_x |= temp & 0x03
         touch_y |= (temp >> 2) & 0x03
-        self._write_reg(reg.INTC2, reg.INTC2_TP)
         return [touch_x, touch_y]
 
     def _gfx_mode(self) -> None:
         """Set to Graphics Mode"""
         if self._mode == "gfx":
             return
-        self._write_data(self._read_reg(reg.MWCR0) & ~reg.MWCR0_TXTMODE)
+        self._write_shadow(reg.MWCR0, self._read_shadow(reg.MWCR0) & ~reg.MWCR0_TXTMODE)
         self._mode = "gfx"
 
     def _txt_mode(self) -> None:
         """Set to Text Mode"""
         if self._mode == "txt":
             return
-        self._write_data(self._read_reg(reg.MWCR0) | reg.MWCR0_TXTMODE)
-        self._write_data(self._read_reg(reg.FNCR0) & ~((1 << 7) | (1 << 5)))
+        self._write_shadow(reg.MWCR0, self._read_shadow(reg.MWCR0) | reg.MWCR0_TXTMODE)
+        self._write_shadow(
+            reg.FNCR0, self._read_shadow(reg.FNCR0) & ~((1 << 7) | (1 << 5))
+        )
         self._mode = "txt"
 
 
@@ -424,9 +655,13 @@ class RA8875Display(RA8875_Device):
     :param DigitalInOut rst: (optional) The reset pin if it exists (default=None)
     :param int width: (optional) The width of the display in pixels (default=800)
     :param int height: (optional) The height of the display in pixels (default=480)
-    :param int baudrate: (optional) The spi speed (default=6000000)
+    :param int baudrate: (optional) The spi speed (default=6000000). Write-heavy code
+        such as bitmap drawing benefits the most from raising it.
     :param int phase: (optional) The spi phase (default=0)
     :param int polarity: (optional) The spi polarity (default=0)
+    :param int read_baudrate: (optional) A slower spi speed for transfers that read
+        from the display, as the RA8875 reads less reliably at high speeds
+        (default=None, which uses baudrate)
     """
 
     # pylint: disable-msg=invalid-name,too-many-arguments
@@ -440,9 +675,27 @@ class RA8875Display(RA8875_Device):
         baudrate: int = 6000000,
         polarity: int = 0,
         phase: int = 0,
+        read_baudrate: Optional[int] = None,
     ) -> None:
         self._txt_scale = 0
-        super().__init__(spi, cs, rst, width, height, baudrate, polarity, phase)
+        # Register write templates for the color channels, only values change
+        cmdwr = reg.CMDWR[0]
+        datwr = reg.DATWR[0]
+        self._bgcolor_buf = bytearray(
+            (cmdwr, 0x60, datwr, 0, cmdwr, 0x61, datwr, 0, cmdwr, 0x62, datwr, 0)
+        )
+        self._color_buf = bytearray(
+            (cmdwr, 0x63, datwr, 0, cmdwr, 0x64, datwr, 0, cmdwr, 0x65, datwr, 0)
+        )
+        # Cursor registers followed by a memory write of a single pixel
+        self._pixel_buf = bytearray(
+            (cmdwr, reg.CURH0, datwr, 0, cmdwr, reg.CURH0 + 1, datwr, 0)
+            + (cmdwr, reg.CURV0, datwr, 0, cmdwr, reg.CURV0 + 1, datwr, 0)
+            + (cmdwr, reg.MRWC, datwr, 0, 0)
+        )
+        super().__init__(
+            spi, cs, rst, width, height, baudrate, polarity, phase, read_baudrate
+        )
 
     # pylint: disable=too-many-arguments
 
@@ -454,31 +707,34 @@ class RA8875Display(RA8875_Device):
         :param int y: The Y coordinate to set the cursor
         """
         self._txt_mode()
-        self._write_reg16(0x2A, x)
-        self._write_reg16(0x2C, y + self.vert_offset)
+        y += self.vert_offset
+        self._write_regs(((0x2A, x), (0x2B, x >> 8), (0x2C, y), (0x2D, y >> 8)))
 
     # pylint: enable-msg=invalid-name
 
-    def txt_color(self, fgcolor: int, bgcolor: int):
+    def txt_color(self, fgcolor: Union[int, bytes], bgcolor: Union[int, bytes]):
         """
         Set the text foreground and background colors
 
-        :param int fgcolor: Foreground Color - The color of the text
-        :param int bgcolor: Background Color - The color behind the text
+        :param fgcolor: Foreground Color - The color of the text
+        :type fgcolor: int or bytes
+        :param bgcolor: Background Color - The color behind the text
+        :type bgcolor: int or bytes
         """
         self.set_color(fgcolor)
         self.set_bgcolor(bgcolor)
-        self._write_data(self._read_reg(reg.FNCR1) & ~(1 << 6))
+        self._write_shadow(reg.FNCR1, self._read_shadow(reg.FNCR1) & ~(1 << 6))
 
-    def txt_trans(self, color: int) -> None:
+    def txt_trans(self, color: Union[int, bytes]) -> None:
         """
         Set the text foreground color with a transparent background
 
-        :param int color: The color of the text
+        :param color: The color of the text
+        :type color: int or bytes
         """
         self._txt_mode()
         self.set_color(color)
-        self._write_data(self._read_reg(reg.FNCR1) | 1 << 6)
+        self._write_shadow(reg.FNCR1, self._read_shadow(reg.FNCR1) | 1 << 6)
 
     def txt_size(self, scale: int) -> None:
         """
@@ -488,7 +744,9 @@ class RA8875Display(RA8875_Device):
         """
         self._txt_mode()
         scale = min(scale, 3)
-        self._write_data((self._read_reg(reg.FNCR1) & ~(0xF)) | (scale << 2) | scale)
+        self._write_shadow(
+            reg.FNCR1, (self._read_shadow(reg.FNCR1) & ~(0xF)) | (scale << 2) | scale
+        )
         self._txt_scale = scale
 
     def txt_write(self, string: str) -> None:
@@ -498,11 +756,20 @@ class RA8875Display(RA8875_Device):
         :param str string: The text string to write
         """
         self._txt_mode()
-        self._write_cmd(reg.MRWC)
-        for char in string:
-            self._write_data(char, True)
-            if self._txt_scale > 0:
-                time.sleep(0.001)
+        chip_select = self._cs
+        scaled = self._txt_scale > 0
+        with self._acquire(scaled) as spi:
+            buf = self._reg_buf
+            buf[1] = reg.MRWC
+            spi.write(buf, end=2)
+            for char in bytes(string, "utf8"):
+                buf[3] = char
+                chip_select.value = True
+                chip_select.value = False
+                spi.write(buf, start=2)
+                if scaled:
+                    # Enlarged glyphs take a while to render
+                    self._send_wait_status(spi, reg.STSR_BUSY)
 
     # pylint: disable-msg=invalid-name
     def setxy(self, x: int, y: int) -> None:
@@ -513,30 +780,57 @@ class RA8875Display(RA8875_Device):
         :param int y: The Y coordinate to set the cursor
         """
         self._gfx_mode()
-        self._write_reg16(reg.CURH0, x)
-        self._write_reg16(reg.CURV0, y + self.vert_offset)
+        y += self.vert_offset
+        self._write_regs(
+            (
+                (reg.CURH0, x),
+                (reg.CURH0 + 1, x >> 8),
+                (reg.CURV0, y),
+                (reg.CURV0 + 1, y >> 8),
+            )
+        )
 
     # pylint: enable-msg=invalid-name
 
-    def set_bgcolor(self, color: int) -> None:
+    def set_bgcolor(self, color: Union[int, bytes]) -> None:
         """
         Set the text background color
 
-        :param int color: The color behind the text
+        :param color: The color behind the text, as a 565 color or from color565_packed
+        :type color: int or bytes
         """
-        self._write_reg(0x60, (color & 0xF800) >> 11)
-        self._write_reg(0x61, (color & 0x07E0) >> 5)
-        self._write_reg(0x62, (color & 0x001F))
+        if color == self._last_bgcolor:
+            return
+        buf = self._bgcolor_buf
+        buf[3], buf[7], buf[11] = _color_regs(color)
+        self._write_frames(buf, 3)
+        self._last_bgcolor = color if isinstance(color, int) else bytes(color)
 
-    def set_color(self, color: int) -> None:
+    def set_color(self, color: Union[int, bytes]) -> None:
         """
         Set the foreground color for graphics/text
 
-        :param int color: The of the text or graphics
+        :param color: The of the text or graphics, as a 565 color or from color565_packed
+        :type color: int or bytes
         """
-        self._write_reg(0x63, (color & 0xF800) >> 11)
-        self._write_reg(0x64, (color & 0x07E0) >> 5)
-        self._write_reg(0x65, (color & 0x001F))
+        with self._acquire() as spi:
+            self._send_color(spi, color)
+
+    def _send_color(self, spi: SPI, color: Union[int, bytes]) -> None:
+        """
+        Set the foreground color on a bus the caller already holds
+
+        :param SPI spi: The bus returned by entering the SPI device
+        :param color: The of the text or graphics, as a 565 color or from color565_packed
+        :type color: int or bytes
+        """
+        if color == self._last_color:
+            return
+        buf = self._color_buf
+        buf[3], buf[7], buf[11] = _color_regs(color)
+        self._send_frames(spi, buf, 3)
+        # Keep a copy so a reused buffer that changes later is not taken as cached
+        self._last_color = color if isinstance(color, int) else bytes(color)
 
     # pylint: disable-msg=invalid-name
     def pixel(self, x: int, y: int, color: int) -> None:
@@ -547,8 +841,19 @@ class RA8875Display(RA8875_Device):
         :param int y: The Y coordinate to set the cursor
         :param int color: The color of the pixel
         """
-        self.setxy(x, y + self.vert_offset)
-        self._write_reg(reg.MRWC, struct.pack(">H", color), True)
+        self._gfx_mode()
+        y += self.vert_offset
+        buf = self._pixel_buf
+        buf[3] = x & 0xFF
+        buf[7] = (x >> 8) & 0xFF
+        buf[11] = y & 0xFF
+        buf[15] = (y >> 8) & 0xFF
+        buf[19] = (color >> 8) & 0xFF
+        buf[20] = color & 0xFF
+        with self._acquire() as spi:
+            self._send_frames(spi, buf, 5)
+            # The final data cycle carries both bytes of the color
+            spi.write(buf, start=20)  # pylint: disable=no-member
 
     # pylint: enable-msg=invalid-name
 
@@ -561,6 +866,36 @@ class RA8875Display(RA8875_Device):
         self._gfx_mode()
         self._write_reg(reg.MRWC, pixel_data, True)
 
+    def push_pixels_fill(self, color: int, count: int, chunk_px: int = 256) -> None:
+        """
+        Push a run of pixels of a single color to the screen.
+
+        :param int color: The color of the pixels
+        :param int count: The number of pixels to push
+        :param int chunk_px: (optional) The number of pixels sent per write (default=256)
+        """
+        if chunk_px < 1:
+            raise ValueError("chunk_px must be at least 1.")
+        if count <= 0:
+            return
+        self._gfx_mode()
+        chunk = bytes(((color >> 8) & 0xFF, color & 0xFF)) * min(count, chunk_px)
+        chunk_size = len(chunk)
+        remaining = count * 2
+        with self._acquire() as spi:
+            self._b1[0] = reg.MRWC
+            spi.write(reg.CMDWR)  # pylint: disable=no-member
+            spi.write(self._b1)  # pylint: disable=no-member
+            self._cs.value = True
+            self._cs.value = False
+            # A single data cycle carries the whole run
+            spi.write(reg.DATWR)  # pylint: disable=no-member
+            while remaining >= chunk_size:
+                spi.write(chunk)  # pylint: disable=no-member
+                remaining -= chunk_size
+            if remaining:
+                spi.write(chunk, end=remaining)  # pylint: disable=no-member
+
     # pylint: disable-msg=invalid-name,too-many-arguments
     def set_window(self, x: int, y: int, width: int, height: int) -> None:
         """
@@ -576,12 +911,46 @@ class RA8875Display(RA8875_Device):
             width = self.width - x
         if y + height >= self.height:
             height = self.height - y
-        # X
-        self._write_reg16(reg.HSAW0, x)
-        self._write_reg16(reg.HEAW0, x + width)
-        # Y
-        self._write_reg16(reg.VSAW0, y)
-        self._write_reg16(reg.VEAW0, y + height)
+        x2 = x + width - 1
+        # Match setxy, which also places rows below the vertical offset
+        y += self.vert_offset
+        y2 = y + height - 1
+        self._write_regs(
+            (
+                # X
+                (reg.HSAW0, x),
+                (reg.HSAW0 + 1, x >> 8),
+                (reg.HEAW0, x2),
+                (reg.HEAW0 + 1, x2 >> 8),
+                # Y
+                (reg.VSAW0, y),
+                (reg.VSAW0 + 1, y >> 8),
+                (reg.VEAW0, y2),
+                (reg.VEAW0 + 1, y2 >> 8),
+            )
+        )
+
+    def draw_pixels(
+        self, x: int, y: int, width: int, height: int, pixel_data: bytearray
+    ) -> None:
+        """
+        Draw a rectangle of pixel data, streaming it to the screen in a single write
+
+        :param int x: The X coordinate of the left side of the rectangle
+        :param int y: The Y coordinate of the top side of the rectangle
+        :param int width: The width of the rectangle
+        :param int height: The height of the rectangle
+        :param bytearray pixel_data: Big-endian 565 pixel data, row by row
+        """
+        # The chip wraps extra pixels back to the top of the window
+        fit = min(width, self.width - x) * min(height, self.height - y)
+        if len(pixel_data) > fit * 2:
+            raise ValueError("pixel_data does not fit in the rectangle.")
+        self.set_window(x, y, width, height)
+        self.setxy(x, y)
+        self.push_pixels(pixel_data)
+        # Back to the full screen window that init() sets up
+        self.set_window(0, 0, self.width, self.height)
 
     # pylint: enable-msg=invalid-name,too-many-arguments
 
@@ -590,11 +959,16 @@ class RA8875(RA8875Display):
     """
     Graphics Library Class for the Display. Contains all the hardware accelerated geometry
     Functions. For full display functionality, use this class. Valid display sizes are
-    currently 800x480 and 480x272.
+    currently 800x480 and 480x272. Colors can be given as 565 values or as the
+    register values returned by color565_packed.
     """
 
+    _recording = None
+
     # pylint: disable-msg=invalid-name,too-many-arguments
-    def rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+    def rect(
+        self, x: int, y: int, width: int, height: int, color: Union[int, bytes]
+    ) -> None:
         """
         Draw a rectangle (HW Accelerated)
 
@@ -602,11 +976,14 @@ class RA8875(RA8875Display):
         :param int y: The Y coordinate of the top side of the rectangle
         :param int width: The width of the rectangle
         :param int height: The height of the rectangle
-        :param int color: The color of the rectangle
+        :param color: The color of the rectangle
+        :type color: int or bytes
         """
         self._rect_helper(x, y, x + width - 1, y + height - 1, color, False)
 
-    def fill_rect(self, x: int, y: int, width: int, height: int, color: int) -> None:
+    def fill_rect(
+        self, x: int, y: int, width: int, height: int, color: Union[int, bytes]
+    ) -> None:
         """
         Draw a filled rectangle (HW Accelerated)
 
@@ -614,31 +991,36 @@ class RA8875(RA8875Display):
         :param int y: The Y coordinate of the top side of the rectangle
         :param int width: The width of the rectangle
         :param int height: The height of the rectangle
-        :param int color: The color of the rectangle
+        :param color: The color of the rectangle
+        :type color: int or bytes
         """
         self._rect_helper(x, y, x + width - 1, y + height - 1, color, True)
 
-    def fill(self, color: int) -> None:
+    def fill(self, color: Union[int, bytes]) -> None:
         """
         Fill the Entire Screen (HW Accelerated)
 
-        :param int color: The color to Fill the screen
+        :param color: The color to Fill the screen
+        :type color: int or bytes
         """
         self._rect_helper(0, 0, self.width - 1, self.height - 1, color, True)
 
-    def circle(self, x_center: int, y_center: int, radius: int, color: int) -> None:
+    def circle(
+        self, x_center: int, y_center: int, radius: int, color: Union[int, bytes]
+    ) -> None:
         """
         Draw a circle (HW Accelerated)
 
         :param int x_center: The X coordinate of the center of the circle
         :param int y_center: The Y coordinate of the center of the circle
         :param int radius: The radius of the circle
-        :param int color: The color of the circle
+        :param color: The color of the circle
+        :type color: int or bytes
         """
         self._circle_helper(x_center, y_center, radius, color, False)
 
     def fill_circle(
-        self, x_center: int, y_center: int, radius: int, color: int
+        self, x_center: int, y_center: int, radius: int, color: Union[int, bytes]
     ) -> None:
         """
         Draw a filled circle (HW Accelerated)
@@ -646,12 +1028,18 @@ class RA8875(RA8875Display):
         :param int x_center: The X coordinate of the center of the circle
         :param int y_center: The Y coordinate of the center of the circle
         :param int radius: The radius of the circle
-        :param int color: The color of the circle
+        :param color: The color of the circle
+        :type color: int or bytes
         """
         self._circle_helper(x_center, y_center, radius, color, True)
 
     def ellipse(
-        self, x_center: int, y_center: int, h_axis: int, v_axis: int, color: int
+        self,
+        x_center: int,
+        y_center: int,
+        h_axis: int,
+        v_axis: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw an ellipse (HW Accelerated)
@@ -660,12 +1048,18 @@ class RA8875(RA8875Display):
         :param int y_center: The Y coordinate of the center of the ellipse
         :param int h_axis: The length of the horizontal axis
         :param int v_axis: The length of the vertical axis
-        :param int color: The color of the ellipse
+        :param color: The color of the ellipse
+        :type color: int or bytes
         """
         self._ellipse_helper(x_center, y_center, h_axis, v_axis, color, False)
 
     def fill_ellipse(
-        self, x_center: int, y_center: int, h_axis: int, v_axis: int, color: int
+        self,
+        x_center: int,
+        y_center: int,
+        h_axis: int,
+        v_axis: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a Filled Ellipse (HW Accelerated)
@@ -674,7 +1068,8 @@ class RA8875(RA8875Display):
         :param int y_center: The Y coordinate of the center of the ellipse
         :param int h_axis: The length of the horizontal axis
         :param int v_axis: The length of the vertical axis
-        :param int color: The color of the ellipse
+        :param color: The color of the ellipse
+        :type color: int or bytes
         """
         self._ellipse_helper(x_center, y_center, h_axis, v_axis, color, True)
 
@@ -685,7 +1080,7 @@ class RA8875(RA8875Display):
         h_axis: int,
         v_axis: int,
         curve_part: int,
-        color: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a Curve (HW Accelerated)
@@ -696,7 +1091,8 @@ class RA8875(RA8875Display):
         :param int h_axis: The length of the horizontal axis of the full ellipse
         :param int v_axis: The length of the vertical axis of the full ellipse
         :param byte curve_part: A number between 0-3 specifying the quarter section
-        :param int color: The color of the curve
+        :param color: The color of the curve
+        :type color: int or bytes
         """
         self._curve_helper(x_center, y_center, h_axis, v_axis, curve_part, color, False)
 
@@ -707,7 +1103,7 @@ class RA8875(RA8875Display):
         h_axis: int,
         v_axis: int,
         curve_part: int,
-        color: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a Filled Curve (HW Accelerated)
@@ -718,12 +1114,20 @@ class RA8875(RA8875Display):
         :param int h_axis: The length of the horizontal axis of the full ellipse
         :param int v_axis: The length of the vertical axis of the full ellipse
         :param byte curve_part: A number between 0-3 specifying the quarter section
-        :param int color: The color of the curve
+        :param color: The color of the curve
+        :type color: int or bytes
         """
         self._curve_helper(x_center, y_center, h_axis, v_axis, curve_part, color, True)
 
     def triangle(
-        self, x1: int, y1: int, x2: int, y2: int, x3: int, y3: int, color: int
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        x3: int,
+        y3: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a Triangle (HW Accelerated)
@@ -734,12 +1138,20 @@ class RA8875(RA8875Display):
         :param int y2: The Y coordinate of the second point of the triangle
         :param int x3: The X coordinate of the third point of the triangle
         :param int y3: The Y coordinate of the third point of the triangle
-        :param int color: The color of the triangle
+        :param color: The color of the triangle
+        :type color: int or bytes
         """
         self._triangle_helper(x1, y1, x2, y2, x3, y3, color, False)
 
     def fill_triangle(
-        self, x1: int, y1: int, x2: int, y2: int, x3: int, y3: int, color: int
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        x3: int,
+        y3: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a Filled Triangle (HW Accelerated)
@@ -750,33 +1162,48 @@ class RA8875(RA8875Display):
         :param int y2: The Y coordinate of the second point of the triangle
         :param int x3: The X coordinate of the third point of the triangle
         :param int y3: The Y coordinate of the third point of the triangle
-        :param int color: The color of the triangle
+        :param color: The color of the triangle
+        :type color: int or bytes
         """
         self._triangle_helper(x1, y1, x2, y2, x3, y3, color, True)
 
-    def hline(self, x: int, y: int, width: int, color: int) -> None:
+    def hline(self, x: int, y: int, width: int, color: Union[int, bytes]) -> None:
         """
         Draw a Horizontal Line (HW Accelerated)
 
         :param int x: The X coordinate of the beginning point of the line
         :param int y: The Y coordinate of the beginning point of the line
         :param int width: The width of the line
-        :param int color: The color of the line
-        """
-        self.line(x, y, x + width - 1, y, color)
+        :param color: The color of the line
+        :type color: int or bytes
+        """
+        self._draw(
+            self._line_regs(x, y, x + width - 1, y, 0x80),
+            color,
+            reg.DCR,
+            reg.DCR_LNSQTR_STATUS,
+        )
 
-    def vline(self, x: int, y: int, height: int, color: int) -> None:
+    def vline(self, x: int, y: int, height: int, color: Union[int, bytes]) -> None:
         """
         Draw a Vertical Line (HW Accelerated)
 
         :param int x: The X coordinate of the beginning point of the line
         :param int y: The Y coordinate of the beginning point of the line
         :param int height: The height of the line
-        :param int color: The color of the line
-        """
-        self.line(x, y, x, y + height - 1, color)
+        :param color: The color of the line
+        :type color: int or bytes
+        """
+        self._draw(
+            self._line_regs(x, y, x, y + height - 1, 0x80),
+            color,
+            reg.DCR,
+            reg.DCR_LNSQTR_STATUS,
+        )
 
-    def line(self, x1: int, y1: int, x2: int, y2: int, color: int) -> None:
+    def line(
+        self, x1: int, y1: int, x2: int, y2: int, color: Union[int, bytes]
+    ) -> None:
         """
         Draw a Line (HW Accelerated)
 
@@ -784,26 +1211,24 @@ class RA8875(RA8875Display):
         :param int y1: The Y coordinate of the beginning point of the line
         :param int x2: The X coordinate of the end point of the line
         :param int y2: The Y coordinate of the end point of the line
-        :param int color: The color of the line
-        """
-        self._gfx_mode()
-
-        # Set Start Point
-        self._write_reg16(0x91, x1)
-        self._write_reg16(0x93, y1 + self.vert_offset)
-
-        # Set End Point
-        self._write_reg16(0x95, x2)
-        self._write_reg16(0x97, y2 + self.vert_offset)
-
-        self.set_color(color)
-
-        # Draw it
-        self._write_reg(reg.DCR, 0x80)
-        self._wait_poll(reg.DCR, reg.DCR_LNSQTR_STATUS)
+        :param color: The color of the line
+        :type color: int or bytes
+        """
+        self._draw(
+            self._line_regs(x1, y1, x2, y2, 0x80),
+            color,
+            reg.DCR,
+            reg.DCR_LNSQTR_STATUS,
+        )
 
     def round_rect(
-        self, x: int, y: int, width: int, height: int, radius: int, color: int
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        radius: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a rounded rectangle
@@ -813,26 +1238,24 @@ class RA8875(RA8875Display):
         :param int width: The width of the rectangle
         :param int height: The height of the rectangle
         :param int radius: The radius of the corners
-        :param int color: The color of the rectangle
-        """
-        self._gfx_mode()
-        self._curve_helper(x + radius, y + radius, radius, radius, 1, color, False)
-        self._curve_helper(
-            x + width - radius - 1, y + radius, radius, radius, 2, color, False
-        )
-        self._curve_helper(
-            x + radius, y + height - radius, radius, radius, 0, color, False
+        :param color: The color of the rectangle
+        :type color: int or bytes
+        """
+        self._draw(
+            self._round_rect_regs(x, y, width, height, radius, False),
+            color,
+            reg.ELLIPSE,
+            reg.ELLIPSE_STATUS,
         )
-        self._curve_helper(
-            x + width - radius - 1, y + height - radius, radius, radius, 3, color, False
-        )
-        self.hline(x + radius, y, width - (radius * 2) - 1, color)
-        self.hline(x + radius, y + height, width - (radius * 2) - 1, color)
-        self.vline(x, y + radius, height - (radius * 2), color)
-        self.vline(x + width - 1, y + radius, height - (radius * 2), color)
 
     def fill_round_rect(
-        self, x: int, y: int, width: int, height: int, radius: int, color: int
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        radius: int,
+        color: Union[int, bytes],
     ) -> None:
         """
         Draw a filled rounded rectangle
@@ -842,64 +1265,211 @@ class RA8875(RA8875Display):
         :param int width: The width of the rectangle
         :param int height: The height of the rectangle
         :param int radius: The radius of the corners
-        :param int color: The color of the rectangle
-        """
-        self._gfx_mode()
-        self._curve_helper(x + radius, y + radius, radius, radius, 1, color, True)
-        self._curve_helper(
-            x + width - radius - 1, y + radius, radius, radius, 2, color, True
-        )
-        self._curve_helper(
-            x + radius, y + height - radius, radius, radius, 0, color, True
+        :param color: The color of the rectangle
+        :type color: int or bytes
+        """
+        self._draw(
+            self._round_rect_regs(x, y, width, height, radius, True),
+            color,
+            reg.ELLIPSE,
+            reg.ELLIPSE_STATUS,
         )
-        self._curve_helper(
-            x + width - radius - 1, y + height - radius, radius, radius, 3, color, True
+
+    def _round_rect_regs(
+        self, x: int, y: int, width: int, height: int, radius: int, filled: bool
+    ) -> Tuple[Tuple[int, int], ...]:
+        """Register writes for a rounded rectangle drawn by the ellipse engine"""
+        # The corners must fit inside the rectangle
+        radius = max(0, min(radius, (width - 2) // 2, (height - 2) // 2))
+        x2 = x + width - 1
+        y += self.vert_offset
+        y2 = y + height - 1
+        return (
+            # Set Start Point
+            (0x91, x),
+            (0x92, x >> 8),
+            (0x93, y),
+            (0x94, y >> 8),
+            # Set End Point
+            (0x95, x2),
+            (0x96, x2 >> 8),
+            (0x97, y2),
+            (0x98, y2 >> 8),
+            # Set Corner Radius
+            (0xA1, radius),
+            (0xA2, radius >> 8),
+            (0xA3, radius),
+            (0xA4, radius >> 8),
+            # Draw it
+            (reg.ELLIPSE, 0xE0 if filled else 0xA0),
         )
-        self._rect_helper(
-            x + radius, y, x + width - radius - 1, y + height - 1, color, True
+
+    def commands(self) -> CommandList:
+        """
+        Record hardware accelerated drawing calls made inside a ``with`` block and
+        send them to the display together when the block ends
+
+        :return: The command list to use as a context manager
+        :rtype: CommandList
+        """
+        return CommandList(self)
+
+    def _acquire(self, read: bool = False) -> spi_device.SPIDevice:
+        """
+        Get the SPI device for a new transaction, sending any recorded shapes first
+
+        :param bool read: (optional) Will the transaction read from the display (default=False)
+        :return: The SPI device to enter
+        :rtype: SPIDevice
+        """
+        self._replay()
+        return super()._acquire(read)
+
+    def _gfx_mode(self) -> None:
+        """Set to Graphics Mode, sending any recorded shapes first"""
+        self._replay()
+        super()._gfx_mode()
+
+    def _replay(self) -> None:
+        """Send the shapes recorded so far so anything else goes after them"""
+        recording = self._recording
+        if recording is not None and recording.shapes:
+            shapes = recording.shapes
+            recording.shapes = []
+            self._recording = None
+            try:
+                self._submit(shapes)
+            finally:
+                self._recording = recording
+
+    def flush(self) -> None:
+        """
+        Send any shapes recorded so far and wait for the last hardware accelerated
+        drawing operation to finish
+        """
+        self._replay()
+        super().flush()
+
+    def _draw(
+        self,
+        regs: Tuple[Tuple[int, int], ...],
+        color: Union[int, bytes],
+        register: int,
+        mask: int,
+    ) -> None:
+        """General Shape Drawing Helper"""
+        if self._recording is not None:
+            self._recording.shapes.append((regs, color, register, mask))
+            return
+        self._gfx_mode()
+        buf = self._pack_regs(regs)
+        # Hold the bus for the color and the shape, which ends with its start bit
+        with self._acquire() as spi:
+            self._send_color(spi, color)
+            self._send_frames(spi, buf, len(regs))
+        # Let the next call program its registers while the shape is drawn
+        self._pending_poll = (register, mask)
+
+    def _submit(self, shapes: List[Tuple[tuple, Union[int, bytes], int, int]]) -> None:
+        """Send shapes, given as their registers, color and status bit, in one go"""
+        if self._recording is not None:
+            self._recording.shapes.extend(shapes)
+            return
+        if self._read_device is not self.spi_device:
+            # Polls need the slower read clock and the writes should not pay
+            # for it, so each shape waits for the last as it gets the bus
+            for shape in shapes:
+                self._draw(*shape)
+            return
+        self._gfx_mode()
+        pending = None
+        with self._acquire() as spi:
+            for regs, color, register, mask in shapes:
+                if pending is not None:
+                    # The shapes share registers, so each must finish first
+                    self._send_wait_poll(spi, *pending)
+                self._send_color(spi, color)
+                self._send_frames(spi, self._pack_regs(regs), len(regs))
+                pending = (register, mask)
+        self._pending_poll = pending
+
+    def _line_regs(
+        self, x1: int, y1: int, x2: int, y2: int, command: int
+    ) -> Tuple[Tuple[int, int], ...]:
+        """Register writes for a line or rectangle between two points"""
+        vert_offset = self.vert_offset
+        y1 += vert_offset
+        y2 += vert_offset
+        return (
+            # Set Start Point
+            (0x91, x1),
+            (0x92, x1 >> 8),
+            (0x93, y1),
+            (0x94, y1 >> 8),
+            # Set End Point
+            (0x95, x2),
+            (0x96, x2 >> 8),
+            (0x97, y2),
+            (0x98, y2 >> 8),
+            # Draw it
+            (reg.DCR, command),
         )
-        self._rect_helper(
-            x, y + radius, x + width - 1, y + height - radius - 1, color, True
+
+    def _ellipse_regs(
+        self, x_center: int, y_center: int, h_axis: int, v_axis: int, command: int
+    ) -> Tuple[Tuple[int, int], ...]:
+        """Register writes for an ellipse or curve"""
+        y_center += self.vert_offset
+        return (
+            # Set X and Y Center
+            (0xA5, x_center),
+            (0xA6, x_center >> 8),
+            (0xA7, y_center),
+            (0xA8, y_center >> 8),
+            # Set Long and Short Axis
+            (0xA1, h_axis),
+            (0xA2, h_axis >> 8),
+            (0xA3, v_axis),
+            (0xA4, v_axis >> 8),
+            # Draw it
+            (reg.ELLIPSE, command),
         )
 
     def _circle_helper(
-        self, x: int, y: int, radius: int, color: int, filled: bool
+        self, x: int, y: int, radius: int, color: Union[int, bytes], filled: bool
     ) -> None:
         """General Circle Drawing Helper"""
-        self._gfx_mode()
+        y += self.vert_offset
 
         # Set X, Y, and Radius
-        self._write_reg16(0x99, x)
-        self._write_reg16(0x9B, y + self.vert_offset)
-        self._write_reg(0x9D, radius)
-
-        self.set_color(color)
-
-        # Draw it
-        self._write_reg(
-            reg.DCR, reg.DCR_CIRC_START | (reg.DCR_FILL if filled else reg.DCR_NOFILL)
+        self._draw(
+            (
+                (0x99, x),
+                (0x9A, x >> 8),
+                (0x9B, y),
+                (0x9C, y >> 8),
+                (0x9D, radius),
+                # Draw it
+                (
+                    reg.DCR,
+                    reg.DCR_CIRC_START | (reg.DCR_FILL if filled else reg.DCR_NOFILL),
+                ),
+            ),
+            color,
+            reg.DCR,
+            reg.DCR_CIRC_STATUS,
         )
-        self._wait_poll(reg.DCR, reg.DCR_CIRC_STATUS)
 
     def _rect_helper(
-        self, x1: int, y1: int, x2: int, y2: int, color: int, filled: bool
+        self, x1: int, y1: int, x2: int, y2: int, color: Union[int, bytes], filled: bool
     ) -> None:
         """General Rectangle Drawing Helper"""
-        self._gfx_mode()
-
-        # Set X and Y
-        self._write_reg16(0x91, x1)
-        self._write_reg16(0x93, y1 + self.vert_offset)
-
-        # Set Width and Height
-        self._write_reg16(0x95, x2)
-        self._write_reg16(0x97, y2 + self.vert_offset)
-
-        self.set_color(color)
-
-        # Draw it
-        self._write_reg(reg.DCR, 0xB0 if filled else 0x90)
-        self._wait_poll(reg.DCR, reg.DCR_LNSQTR_STATUS)
+        self._draw(
+            self._line_regs(x1, y1, x2, y2, 0xB0 if filled else 0x90),
+            color,
+            reg.DCR,
+            reg.DCR_LNSQTR_STATUS,
+        )
 
     def _triangle_helper(
         self,
@@ -909,25 +1479,37 @@ class RA8875(RA8875Display):
         y2: int,
         x3: int,
         y3: int,
-        color: int,
+        color: Union[int, bytes],
         filled: bool,
     ) -> None:
         """General Triangle Drawing Helper"""
-        self._gfx_mode()
+        vert_offset = self.vert_offset
+        y1 += vert_offset
+        y2 += vert_offset
+        y3 += vert_offset
 
         # Set Point Coordinates
-        self._write_reg16(0x91, x1)
-        self._write_reg16(0x93, y1 + self.vert_offset)
-        self._write_reg16(0x95, x2)
-        self._write_reg16(0x97, y2 + self.vert_offset)
-        self._write_reg16(0xA9, x3)
-        self._write_reg16(0xAB, y3 + self.vert_offset)
-
-        self.set_color(color)
-
-        # Draw it
-        self._write_reg(reg.DCR, 0xA1 if filled else 0x81)
-        self._wait_poll(reg.DCR, reg.DCR_LNSQTR_STATUS)
+        self._draw(
+            (
+                (0x91, x1),
+                (0x92, x1 >> 8),
+                (0x93, y1),
+                (0x94, y1 >> 8),
+                (0x95, x2),
+                (0x96, x2 >> 8),
+                (0x97, y2),
+                (0x98, y2 >> 8),
+                (0xA9, x3),
+                (0xAA, x3 >> 8),
+                (0xAB, y3),
+                (0xAC, y3 >> 8),
+                # Draw it
+                (reg.DCR, 0xA1 if filled else 0x81),
+            ),
+            color,
+            reg.DCR,
+            reg.DCR_LNSQTR_STATUS,
+        )
 
     def _curve_helper(
         self,
@@ -936,25 +1518,22 @@ class RA8875(RA8875Display):
         h_axis: int,
         v_axis: int,
         curve_part: int,
-        color: int,
+        color: Union[int, bytes],
         filled: bool,
     ) -> None:
         """General Curve Drawing Helper"""
-        self._gfx_mode()
-
-        # Set X and Y Center
-        self._write_reg16(0xA5, x_center)
-        self._write_reg16(0xA7, y_center + self.vert_offset)
-
-        # Set Long and Short Axis
-        self._write_reg16(0xA1, h_axis)
-        self._write_reg16(0xA3, v_axis)
-
-        self.set_color(color)
-
-        # Draw it
-        self._write_reg(reg.ELLIPSE, (0xD0 if filled else 0x90) | (curve_part & 0x03))
-        self._wait_poll(reg.ELLIPSE, reg.ELLIPSE_STATUS)
+        self._draw(
+            self._ellipse_regs(
+                x_center,
+                y_center,
+                h_axis,
+                v_axis,
+                (0xD0 if filled else 0x90) | (curve_part & 0x03),
+            ),
+            color,
+            reg.ELLIPSE,
+            reg.ELLIPSE_STATUS,
+        )
 
     def _ellipse_helper(
         self,
@@ -962,24 +1541,17 @@ class RA8875(RA8875Display):
         y_center: int,
         h_axis: int,
         v_axis: int,
-        color: int,
+        color: Union[int, bytes],
         filled: bool,
     ) -> None:
         """General Ellipse Drawing Helper"""
-        self._gfx_mode()
-
-        # Set X and Y  Center
-        self._write_reg16(0xA5, x_center)
-        self._write_reg16(0xA7, y_center + self.vert_offset)
-
-        # Set Long and Short Axis
-        self._write_reg16(0xA1, h_axis)
-        self._write_reg16(0xA3, v_axis)
-
-        self.set_color(color)
-
-        # Draw it
-        self._write_reg(reg.ELLIPSE, 0xC0 if filled else 0x80)
-        self._wait_poll(reg.ELLIPSE, reg.ELLIPSE_STATUS)
+        self._draw(
+            self._ellipse_regs(
+                x_center, y_center, h_axis, v_axis, 0xC0 if filled else 0x80
+            ),
+            color,
+            reg.ELLIPSE,
+            reg.ELLIPSE_STATUS,
+        )
 
     # pylint: enable-msg=invalid-name,too-many-arguments
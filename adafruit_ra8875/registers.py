@@ -17,6 +17,9 @@ DATRD = b"\x40"  # Data Read
 CMDWR = b"\x80"  # Command Write
 CMDRD = b"\xC0"  # Status Read
 
+# Status Register Bits
+STSR_BUSY = 0x80
+
 # Registers and Bits
 PWRR = 0x01
 PWRR_DISPON = 0x80
@@ -17,20 +17,46 @@ WHITE = color565(255, 255, 255)
 cs_pin = digitalio.DigitalInOut(board.D9)
 rst_pin = digitalio.DigitalInOut(board.D10)
 
-# Config for display baudrate (default max is 6mhz):
-BAUDRATE = 8000000
+# Config for display baudrate (default max is 6mhz). The first writes of
+# init() run before the faster system clock is started, so they need 6mhz.
+# Once that clock is running the RA8875 accepts faster writes than reads, and
+# bitmaps are write-heavy: to try it, set BAUDRATE to 12000000 and keep status
+# reads at READ_BAUDRATE. 12mhz is not guaranteed to work with every display,
+# so only keep it if drawing stays reliable.
+BAUDRATE = 6000000
+READ_BAUDRATE = 6000000
 
 # Setup SPI bus using hardware SPI:
 spi = busio.SPI(clock=board.SCK, MOSI=board.MOSI, MISO=board.MISO)
 
 # Create and setup the RA8875 display:
-display = ra8875.RA8875(spi, cs=cs_pin, rst=rst_pin, baudrate=BAUDRATE)
+display = ra8875.RA8875(
+    spi, cs=cs_pin, rst=rst_pin, baudrate=BAUDRATE, read_baudrate=READ_BAUDRATE
+)
 display.init()
 display.fill(WHITE)
 
 
-def convert_555_to_565(rgb):
-    return (rgb & 0x7FE0) << 1 | 0x20 | rgb & 0x001F
+# Lookup tables converting the high and low bytes of a 555 pixel to 565.
+# The new green LSB is a copy of the green MSB (bit 1 of the high byte).
+HIGH_555_TO_565 = bytes((b << 1) & 0xFE for b in range(256))
+LOW_555_TO_565 = bytes((b << 1) & 0xC0 | b & 0x1F for b in range(256))
+
+
+# Pack count BGR pixels spaced step bytes apart into big-endian 565.
+# Only plain integer locals are used so the loop stays cheap to interpret.
+# ra8875.color565_buffer does the same packing, but it expects RGB order with
+# no padding byte, while BMP rows are BGR and 32-bit files carry a fourth byte,
+# so the example keeps this variant that writes straight into the chunk.
+def pack_bgr_line(src, step, dst, offset, count):
+    i = 0
+    while count:
+        g = src[i + 1]
+        dst[offset] = src[i + 2] & 0xF8 | g >> 5
+        dst[offset + 1] = (g << 3) & 0xE0 | src[i] >> 3
+        i += step
+        offset += 2
+        count -= 1
 
 
 class BMP:
@@ -48,44 +74,55 @@ class BMP:
         if self.colors:
             return
         with open(self.filename, "rb") as f:
-            f.seek(10)
-            self.data = int.from_bytes(f.read(4), "little")
-            f.seek(18)
-            self.width = int.from_bytes(f.read(4), "little")
-            self.height = int.from_bytes(f.read(4), "little")
-            f.seek(28)
-            self.bpp = int.from_bytes(f.read(2), "little")
-            f.seek(34)
-            self.data_size = int.from_bytes(f.read(4), "little")
-            f.seek(46)
-            self.colors = int.from_bytes(f.read(4), "little")
-
-    def draw(self, disp, x=0, y=0):
-        print("{:d}x{:d} image".format(self.width, self.height))
+            header = f.read(50)
+        (self.data,) = struct.unpack_from("<I", header, 10)
+        self.width, self.height = struct.unpack_from("<ii", header, 18)
+        (self.bpp,) = struct.unpack_from("<H", header, 28)
+        (self.data_size,) = struct.unpack_from("<I", header, 34)
+        (self.colors,) = struct.unpack_from("<I", header, 46)
+
+    def draw(self, disp, x=0, y=0, chunk_size=None):  # pylint: disable=too-many-locals
+        width = self.width
+        height = self.height
+        bytes_per_pixel = self.bpp // 8
+        print("{:d}x{:d} image".format(width, height))
         print("{:d}-bit encoding detected".format(self.bpp))
-        line = 0
-        line_size = self.width * (self.bpp // 8)
-        if line_size % 4 != 0:
-            line_size += 4 - line_size % 4
-        current_line_data = b""
+        # BMP rows are padded to a multiple of 4 bytes
+        line_size = (width * bytes_per_pixel + 3) & ~3
+        row_size = width * 2
+        # Push around 4KB per transfer by default
+        if chunk_size is None:
+            chunk_size = max(1, 4096 // row_size)
+        current_line_data = bytearray(row_size * chunk_size)
+        line_data = bytearray(line_size)
         with open(self.filename, "rb") as f:
             f.seek(self.data)
-            disp.set_window(x, y, self.width, self.height)
-            for line in range(self.height):
-                current_line_data = b""
-                line_data = f.read(line_size)
-                for i in range(0, line_size, self.bpp // 8):
-                    if (line_size - i) < self.bpp // 8:
-                        break
-                    if self.bpp == 16:
-                        color = convert_555_to_565(line_data[i] | line_data[i + 1] << 8)
-                    if self.bpp in (24, 32):
-                        color = color565(
-                            line_data[i + 2], line_data[i + 1], line_data[i]
+            disp.set_window(x, y, width, height)
+            for start_line in range(0, height, chunk_size):
+                lines = min(chunk_size, height - start_line)
+                for line in range(lines):
+                    # BMP lines are stored bottom-up, so fill the chunk from the end
+                    offset = (lines - 1 - line) * row_size
+                    f.readinto(line_data)
+                    if bytes_per_pixel == 2:
+                        for i in range(0, row_size, 2):
+                            high = line_data[i + 1]
+                            low = line_data[i]
+                            current_line_data[offset] = HIGH_555_TO_565[high] | low >> 7
+                            current_line_data[offset + 1] = (
+                                LOW_555_TO_565[low] | (high & 0x02) << 4
+                            )
+                            offset += 2
+                    else:
+                        pack_bgr_line(
+                            line_data,
+                            bytes_per_pixel,
+                            current_line_data,
+                            offset,
+                            width,
                         )
-                    current_line_data = current_line_data + struct.pack(">H", color)
-                disp.setxy(x, self.height - line + y)
-                disp.push_pixels(current_line_data)
+                disp.setxy(x, y + height - start_line - lines)
+                disp.push_pixels(memoryview(current_line_data)[: lines * row_size])
             disp.set_window(0, 0, disp.width, disp.height)
 
 
@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Check draw_pixels against a fake RA8875 that keeps a frame buffer"""
+
+import sys
+import time
+import types
+
+import pytest
+
+
+class FakeRA8875:
+    """Decode the SPI cycles into registers and frame buffer writes"""
+
+    def __init__(self):
+        self.regs = {0x00: 0x75}
+        self.pixels = {}
+        self.frame = []
+        self.reg = 0
+        self.half = None
+
+    def reg16(self, low):
+        return self.regs.get(low, 0) | self.regs.get(low + 1, 0) << 8
+
+    def _put(self, value):
+        x, y = self.reg16(0x46), self.reg16(0x48)
+        self.pixels[(x, y)] = value
+        x += 1
+        if x > self.reg16(0x34):
+            x, y = self.reg16(0x30), y + 1
+            if y > self.reg16(0x36):
+                y = self.reg16(0x32)
+        self.regs.update({0x46: x & 0xFF, 0x47: x >> 8, 0x48: y & 0xFF, 0x49: y >> 8})
+
+    def transfer(self, data):
+        out = []
+        for byte in data:
+            self.frame.append(byte)
+            result = 0
+            cycle = self.frame[0]
+            if len(self.frame) == 1:
+                self.half = None
+            elif cycle == 0x80:
+                self.reg = byte
+            elif cycle == 0x00 and self.reg == 0x02:
+                if self.half is None:
+                    self.half = byte
+                else:
+                    self._put(self.half << 8 | byte)
+                    self.half = None
+            elif cycle == 0x00:
+                self.regs[self.reg] = byte
+            elif cycle == 0x40:
+                # Report every engine as idle
+                result = 0 if self.reg in (0x90, 0xA0) else self.regs.get(self.reg, 0)
+            out.append(result)
+        return out
+
+    # busio.SPI
+    def write(self, buf, start=0, end=None):
+        self.transfer(bytes(buf[start:end]))
+
+    def readinto(self, buf, start=0, end=None, write_value=0):
+        end = len(buf) if end is None else end
+        for i, value in enumerate(self.transfer([write_value] * (end - start))):
+            buf[start + i] = value
+
+    def write_readinto(self, buffer_out, buffer_in):
+        for i, value in enumerate(self.transfer(bytes(buffer_out))):
+            buffer_in[i] = value
+
+
+class FakePin:
+    """Chip select that frames the SPI cycles of the fake display"""
+
+    def __init__(self, chip):
+        self.chip = chip
+        self._value = True
+        self.direction = None
+
+    def switch_to_output(self, value=True):
+        self.value = value
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if self._value and not value:
+            self.chip.frame = []
+        self._value = value
+
+
+class FakeSPIDevice:
+    """Select the fake display for the length of a transaction"""
+
+    def __init__(self, spi, chip_select, baudrate=100000, polarity=0, phase=0):
+        # pylint: disable=unused-argument,too-many-arguments
+        self.spi = spi
+        self.chip_select = chip_select
+        chip_select.switch_to_output(value=True)
+
+    def __enter__(self):
+        self.chip_select.value = False
+        return self.spi
+
+    def __exit__(self, *exc):
+        self.chip_select.value = True
+        return False
+
+
+digitalio = types.ModuleType("digitalio")
+digitalio.Direction = types.SimpleNamespace(INPUT=0, OUTPUT=1)
+digitalio.DigitalInOut = FakePin
+busio = types.ModuleType("busio")
+busio.SPI = FakeRA8875
+bus_device = types.ModuleType("adafruit_bus_device")
+bus_device.spi_device = types.ModuleType("adafruit_bus_device.spi_device")
+bus_device.spi_device.SPIDevice = FakeSPIDevice
+sys.modules.setdefault("busio", busio)
+sys.modules.setdefault("digitalio", digitalio)
+sys.modules.setdefault("adafruit_bus_device", bus_device)
+sys.modules.setdefault("adafruit_bus_device.spi_device", bus_device.spi_device)
+
+from adafruit_ra8875 import ra8875  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(name="make_display")
+def fixture_make_display(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+    def make_display(width, height):
+        chip = FakeRA8875()
+        display = ra8875.RA8875(chip, FakePin(chip), width=width, height=height)
+        display.init()
+        return chip, display
+
+    return make_display
+
+
+def window(chip):
+    return tuple(chip.reg16(low) for low in (0x30, 0x32, 0x34, 0x36))
+
+
+def test_draw_pixels_in_window(make_display):
+    chip, display = make_display(800, 480)
+    full_window = window(chip)
+    display.draw_pixels(798, 5, 3, 2, bytes(range(8)))
+    # Clipped to the right edge, so each row holds two pixels
+    assert chip.pixels == {
+        (798, 5): 0x0001,
+        (799, 5): 0x0203,
+        (798, 6): 0x0405,
+        (799, 6): 0x0607,
+    }
+    assert window(chip) == full_window
+
+
+def test_draw_pixels_vert_offset(make_display):
+    chip, display = make_display(480, 82)
+    assert display.vert_offset == 190
+    full_window = window(chip)
+    display.draw_pixels(10, 20, 3, 2, bytes(range(12)))
+    assert chip.pixels == {
+        (10, 210): 0x0001,
+        (11, 210): 0x0203,
+        (12, 210): 0x0405,
+        (10, 211): 0x0607,
+        (11, 211): 0x0809,
+        (12, 211): 0x0A0B,
+    }
+    assert window(chip) == full_window
+
+
+def test_draw_pixels_too_much_data(make_display):
+    chip, display = make_display(800, 480)
+    with pytest.raises(ValueError):
+        display.draw_pixels(10, 20, 3, 2, bytes(14))
+    with pytest.raises(ValueError):
+        # Clipped to 2x2 by the right edge of the screen
+        display.draw_pixels(798, 0, 3, 2, bytes(12))
+    assert not chip.pixels